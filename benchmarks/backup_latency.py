@@ -0,0 +1,82 @@
+"""Measure add_vote latency with and without an online backup running.
+
+Usage: python -m benchmarks.backup_latency [suggestions]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from database.backup import BackupManager
+from database.db import Database
+
+
+def populate(db: Database, count: int):
+    conn = db.get_connection()
+    text = "x" * 500
+    conn.executemany(
+        "INSERT INTO suggestions (message_id, user_id, suggestion, status, category, is_anonymous, timestamp) "
+        "VALUES (?, ?, ?, 'Pending', 'General', 0, ?)",
+        ((i, i % 5000, text, datetime.now()) for i in range(count))
+    )
+    conn.executemany(
+        "INSERT INTO votes (message_id, user_id, vote_type) VALUES (?, ?, ?)",
+        ((i % count, i, '👍') for i in range(count * 5))
+    )
+    conn.commit()
+
+
+async def measure_votes(db: Database, stop: asyncio.Event, count: int = 10 ** 9):
+    latencies = []
+    while not stop.is_set() and len(latencies) < count:
+        start = time.perf_counter()
+        db.add_vote(random.randrange(1000), random.randrange(10 ** 9), '👎')
+        latencies.append((time.perf_counter() - start) * 1000)
+        # Yield so the phase being measured can finish, without throttling the sample rate
+        await asyncio.sleep(0)
+    return latencies
+
+
+def report(label: str, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<16} n={len(latencies):<6} p50={statistics.median(latencies):.3f}ms "
+          f"p99={p99:.3f}ms max={latencies[-1]:.3f}ms")
+
+
+async def during(label: str, db: Database, backups: BackupManager, func, *args):
+    """Run `func` on the backup worker thread while measuring vote latency"""
+    stop = asyncio.Event()
+    votes = asyncio.create_task(measure_votes(db, stop))
+    start = time.perf_counter()
+    await backups._run(func, *args)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    report(label, await votes)
+    print(f"{'':<16} {label} took {elapsed:.2f}s")
+
+
+async def main(count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        populate(db, count)
+        print(f"database size: {os.path.getsize(db.db_file) / 2 ** 20:.1f} MiB")
+
+        report("idle", await measure_votes(db, asyncio.Event(), 20000))
+
+        # Time the backup-API copy and the gzip pass separately; only the first
+        # touches the shared connection.
+        backups = BackupManager(db, backup_dir=tmp)
+        raw_path = os.path.join(tmp, "snapshot.db")
+        path = os.path.join(tmp, "snapshot.db.gz")
+        await during("snapshot", db, backups, backups._snapshot, raw_path)
+        await during("compress", db, backups, backups._compress, raw_path, path)
+        print(f"compressed snapshot: {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000))
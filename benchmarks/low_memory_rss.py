@@ -0,0 +1,123 @@
+"""Compare resident memory of the default and low-memory modes.
+
+Feeds synthetic GUILD_CREATE and gateway events for thousands of guilds into
+the bot's connection state, sending only what Discord would deliver for the
+intents each mode requests. Each mode runs in its own process.
+
+Usage: python -m benchmarks.low_memory_rss [guilds]
+"""
+import asyncio
+import gc
+import subprocess
+import sys
+
+CHANNELS_PER_GUILD = 20
+ROLES_PER_GUILD = 15
+EMOJIS_PER_GUILD = 30
+VOICE_USERS_PER_GUILD = 10
+MESSAGES_PER_GUILD = 20
+
+
+def rss_mib() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def user(user_id: int) -> dict:
+    return {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None}
+
+
+def member(user_id: int) -> dict:
+    return {"user": user(user_id), "roles": [], "joined_at": "2024-01-01T00:00:00+00:00", "flags": 0}
+
+
+def guild_payload(guild_id: int, self_id: int, intents) -> dict:
+    base = guild_id * 1000
+    channels = [
+        {"id": str(base + i), "type": 0, "name": f"channel-{i}", "position": i, "guild_id": str(guild_id),
+         "permission_overwrites": []}
+        for i in range(CHANNELS_PER_GUILD)
+    ]
+    members = [member(self_id)]
+    voice_states = []
+    # Without the voice_states intent Discord omits voice states and their members
+    if intents.voice_states:
+        for i in range(VOICE_USERS_PER_GUILD):
+            voice_member = member(base + 500 + i)
+            members.append(voice_member)
+            voice_states.append({"user_id": str(base + 500 + i), "channel_id": str(base), "session_id": "x",
+                                 "deaf": False, "mute": False, "self_deaf": False, "self_mute": False,
+                                 "self_video": False, "suppress": False, "member": voice_member})
+    return {
+        "id": str(guild_id), "name": f"guild-{guild_id}", "owner_id": str(self_id), "member_count": 1000,
+        "large": False, "channels": channels, "members": members, "voice_states": voice_states,
+        "threads": [], "presences": [], "features": [], "stickers": [],
+        "roles": [{"id": str(base + 900 + i), "name": f"role-{i}", "permissions": "0", "position": i,
+                   "color": 0, "hoist": False, "managed": False, "mentionable": False}
+                  for i in range(ROLES_PER_GUILD)],
+        "emojis": [{"id": str(base + 950 + i), "name": f"emoji{i}", "roles": [], "require_colons": True,
+                    "managed": False, "animated": False, "available": True}
+                   for i in range(EMOJIS_PER_GUILD)],
+    }
+
+
+def message_payload(message_id: int, guild_id: int, content: bool) -> dict:
+    author = user(guild_id * 1000 + 700 + message_id % 50)
+    return {
+        "id": str(message_id), "channel_id": str(guild_id * 1000), "guild_id": str(guild_id),
+        "author": author, "member": {"roles": [], "joined_at": "2024-01-01T00:00:00+00:00", "flags": 0},
+        "content": "some chat message " * 5 if content else "", "timestamp": "2024-01-01T00:00:00+00:00",
+        "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [],
+        "mention_roles": [], "attachments": [], "embeds": [], "pinned": False, "type": 0,
+    }
+
+
+async def simulate(guilds: int):
+    import discord
+    from main import SuggestionBot
+
+    bot = SuggestionBot()
+    await bot._async_setup_hook()
+    state = bot._connection
+    state.user = discord.ClientUser(state=state, data={**user(1), "bot": True})
+    gc.collect()
+    baseline = rss_mib()
+
+    for guild_id in range(1, guilds + 1):
+        state._add_guild_from_data(guild_payload(guild_id, 1, state.intents))
+
+    # Without the guild_messages intent Discord sends no MESSAGE_CREATE events at all
+    if state.intents.guild_messages:
+        message_id = 10 ** 12
+        for _ in range(MESSAGES_PER_GUILD):
+            for guild_id in range(1, guilds + 1):
+                message_id += 1
+                state.parse_message_create(message_payload(message_id, guild_id, state.intents.message_content))
+            # Let the dispatched on_message handlers run
+            await asyncio.sleep(0)
+
+    gc.collect()
+    members = sum(len(guild.members) for guild in bot.guilds)
+    cached = len(state._messages) if state._messages is not None else 0
+    print(f"{len(bot.guilds)} guilds: +{rss_mib() - baseline:.1f} MiB RSS, "
+          f"{members} cached members, {cached} cached messages")
+
+
+def main():
+    guilds = sys.argv[1] if len(sys.argv) > 1 else "5000"
+    if len(sys.argv) > 2:
+        from config import Config
+        Config.LOW_MEMORY_MODE = sys.argv[2] == "low"
+        asyncio.run(simulate(int(guilds)))
+        return
+
+    for mode in ("default", "low"):
+        print(f"{mode:<8}", end=" ", flush=True)
+        subprocess.run([sys.executable, "-m", "benchmarks.low_memory_rss", guilds, mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from database.db import Database
+from database.backup import BackupManager
+from utils import profiling
 from config import Config
+import asyncio
+import io
 import logging
+import os
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -28,10 +33,31 @@ class Admin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = Database()
+        self.backups = BackupManager(self.db)
+        self._profile_lock = asyncio.Lock()
+
+    async def cog_load(self):
+        if Config.BACKUP_INTERVAL > 0:
+            self.scheduled_backup.start()
+
+    async def cog_unload(self):
+        self.scheduled_backup.cancel()
 
     def is_admin(interaction: discord.Interaction) -> bool:
         return interaction.user.guild_permissions.administrator
 
+    async def is_owner(interaction: discord.Interaction) -> bool:
+        # Backups cover every guild, so only the bot owner may manage them
+        return await interaction.client.is_owner(interaction.user)
+
+    @tasks.loop(seconds=Config.BACKUP_INTERVAL or 3600)
+    async def scheduled_backup(self):
+        await self.backups.create_backup()
+
+    @scheduled_backup.before_loop
+    async def before_scheduled_backup(self):
+        await self.bot.wait_until_ready()
+
     @app_commands.command(name="setchannel", description="Set the suggestions channel")
     @app_commands.check(is_admin)
     async def setchannel(self, interaction: discord.Interaction, channel: discord.TextChannel):
@@ -190,11 +216,107 @@ class Admin(commands.Cog):
             ephemeral=True
         )
 
-    async def get_suggestion_channel(self, guild_id: int) -> Optional[discord.TextChannel]:
+    @app_commands.command(name="backup", description="Take a database backup now")
+    @app_commands.check(is_owner)
+    async def backup(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        path = await self.backups.create_backup()
+        if path:
+            await interaction.followup.send(f"Backup written: {os.path.basename(path)}", ephemeral=True)
+        else:
+            await interaction.followup.send("Backup failed", ephemeral=True)
+
+    @app_commands.command(name="backups", description="List available database backups")
+    @app_commands.check(is_owner)
+    async def backups_list(self, interaction: discord.Interaction):
+        names = self.backups.list_backups()
+        if not names:
+            await interaction.response.send_message("No backups found", ephemeral=True)
+            return
+        await interaction.response.send_message(
+            "**Available backups:**\n" + "\n".join(names[:20]),
+            ephemeral=True
+        )
+
+    @app_commands.command(name="restore", description="Restore the database from a backup")
+    @app_commands.check(is_owner)
+    async def restore(self, interaction: discord.Interaction, name: str):
+        if name not in self.backups.list_backups():
+            await interaction.response.send_message("Backup not found", ephemeral=True)
+            return
+
+        view = ConfirmView()
+        await interaction.response.send_message(
+            f"Are you sure you want to restore {name}? Current data will be replaced "
+            f"(a backup of it is taken first).",
+            view=view,
+            ephemeral=True
+        )
+
+        await view.wait()
+        if view.value:
+            restored = await self.backups.restore_backup(name)
+            await interaction.edit_original_response(
+                content=f"Restored database from {name}" if restored else "Restore failed",
+                view=None
+            )
+        else:
+            await interaction.edit_original_response(
+                content="Operation cancelled",
+                view=None
+            )
+
+    profile = app_commands.Group(name="profile", description="Capture profiling data from the running bot")
+
+    @profile.command(name="cpu", description="Profile the event loop for a number of seconds")
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="Sampling", value="sampling"),
+        app_commands.Choice(name="cProfile", value="cprofile")
+    ])
+    @app_commands.check(is_owner)
+    async def profile_cpu(self, interaction: discord.Interaction, seconds: int = 30, mode: str = "sampling"):
+        await self.run_profile(interaction, seconds, profiling.profile_cpu, mode)
+
+    @profile.command(name="memory", description="Diff tracemalloc snapshots over a number of seconds")
+    @app_commands.check(is_owner)
+    async def profile_memory(self, interaction: discord.Interaction, seconds: int = 30):
+        await self.run_profile(interaction, seconds, profiling.profile_memory)
+
+    @profile.command(name="tasks", description="Dump asyncio task stacks and watch for slow callbacks")
+    @app_commands.check(is_owner)
+    async def profile_tasks(self, interaction: discord.Interaction, seconds: int = 10):
+        await self.run_profile(interaction, seconds, profiling.dump_tasks, Config.PROFILE_SLOW_CALLBACK)
+
+    async def run_profile(self, interaction: discord.Interaction, seconds: int, profiler, *args):
+        if not 0 <= seconds <= Config.PROFILE_MAX_SECONDS:
+            await interaction.response.send_message(
+                f"Duration must be between 0 and {Config.PROFILE_MAX_SECONDS} seconds", ephemeral=True
+            )
+            return
+        if self._profile_lock.locked():
+            await interaction.response.send_message("A profiling session is already running", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        try:
+            async with self._profile_lock:
+                reports = await profiler(seconds, *args)
+
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            files = [
+                discord.File(io.BytesIO(content.encode()), f"{stamp}_{name}")
+                for name, content in reports.items()
+            ]
+            await interaction.followup.send("Here are the profiling results:", files=files, ephemeral=True)
+        except Exception as e:
+            logging.error(f"Profiling failed: {e}")
+            await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
+
+    async def get_suggestion_channel(self, guild_id: int) -> Optional[discord.abc.Messageable]:
         channel_id = self.db.get_suggestion_channel(guild_id)
         if not channel_id:
             return None
-        return self.bot.get_channel(channel_id)
+        return self.bot.get_channel(channel_id) or self.bot.get_partial_messageable(channel_id, guild_id=guild_id)
 
 async def setup(bot):
     await bot.add_cog(Admin(bot))
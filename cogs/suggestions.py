@@ -1,15 +1,19 @@
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
 from database.db import Database
 from utils.helpers import check_rate_limit, get_rate_limit_remaining, sanitize_input
+from utils.reconcile import VoteReconciler
 from config import Config
 
 class Suggestions(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = Database()
+        self.reconciler = VoteReconciler(bot, self.db)
+        self._reconcile_lock = asyncio.Lock()
 
     @app_commands.command(name="suggest", description="Add a suggestion")
     async def suggest(self, interaction: discord.Interaction, suggestion: str, category: str = "General", anonymous: bool = False):
@@ -143,12 +147,13 @@ class Suggestions(commands.Cog):
                 return
 
             channel_id = self.db.get_suggestion_channel(interaction.guild_id)
-            channel = self.bot.get_channel(channel_id)
-            if not channel:
+            if not channel_id:
                 await interaction.response.send_message("Suggestion channel not found", ephemeral=True)
                 return
 
             try:
+                # Only the embed is needed, so skip resolving the channel from cache
+                channel = self.bot.get_partial_messageable(channel_id, guild_id=interaction.guild_id)
                 message = await channel.fetch_message(msg_id)
                 embed = message.embeds[0]
                 embed.description = new_text
@@ -192,6 +197,17 @@ class Suggestions(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     # Reaction handling
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # on_ready fires again after a full reconnect; catch up on votes missed meanwhile
+        if Config.RECONCILE_DAYS <= 0 or self._reconcile_lock.locked():
+            return
+        try:
+            async with self._reconcile_lock:
+                await self.reconciler.run()
+        except Exception as e:
+            print(f"Error reconciling votes: {e}")
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
         try:
@@ -199,6 +215,7 @@ class Suggestions(commands.Cog):
                 return
 
             if str(payload.emoji) in ['👍', '👎']:
+                self.reconciler.record_live_vote(payload.message_id, payload.user_id)
                 self.db.add_vote(payload.message_id, payload.user_id, str(payload.emoji))
         except Exception as e:
             print(f"Error handling reaction: {e}")
@@ -207,6 +224,7 @@ class Suggestions(commands.Cog):
     async def on_raw_reaction_remove(self, payload):
         try:
             if str(payload.emoji) in ['👍', '👎']:
+                self.reconciler.record_live_vote(payload.message_id, payload.user_id)
                 self.db.remove_vote(payload.message_id, payload.user_id)
         except Exception as e:
             print(f"Error handling reaction removal: {e}")
@@ -12,4 +12,23 @@ class Config:
     RATE_LIMIT_DURATION = int(os.getenv('RATE_LIMIT_DURATION', 300))  # 5 minutes
     MAX_SUGGESTIONS_PER_USER = int(os.getenv('MAX_SUGGESTIONS_PER_USER', 3))
     
+    # Trim intents and caches for deployments in many guilds
+    LOW_MEMORY_MODE = os.getenv('LOW_MEMORY_MODE', 'false').lower() in ('1', 'true', 'yes')
+    
+    # Backup configuration
+    BACKUP_DIR = os.getenv('BACKUP_DIR', 'backups')
+    BACKUP_INTERVAL = int(os.getenv('BACKUP_INTERVAL', 3600))  # 1 hour
+    BACKUP_RETENTION = int(os.getenv('BACKUP_RETENTION', 24))  # snapshots kept
+    BACKUP_PAGES_PER_STEP = int(os.getenv('BACKUP_PAGES_PER_STEP', 64))
+    BACKUP_STEP_SLEEP = float(os.getenv('BACKUP_STEP_SLEEP', 0.01))  # seconds between steps
+    
+    # Startup vote reconciliation
+    RECONCILE_DAYS = int(os.getenv('RECONCILE_DAYS', 14))  # 0 disables reconciliation
+    RECONCILE_CONCURRENCY = int(os.getenv('RECONCILE_CONCURRENCY', 4))
+    RECONCILE_BATCH_SIZE = int(os.getenv('RECONCILE_BATCH_SIZE', 50))  # messages per transaction
+    
+    # On-demand profiling
+    PROFILE_MAX_SECONDS = int(os.getenv('PROFILE_MAX_SECONDS', 300))
+    PROFILE_SLOW_CALLBACK = float(os.getenv('PROFILE_SLOW_CALLBACK', 0.1))  # seconds
+    
     VALID_STATUSES = ['Pending', 'Accepted', 'Rejected', 'Under Review']
@@ -0,0 +1,169 @@
+import asyncio
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from config import Config
+from database.db import Database
+
+BACKUP_PREFIX = "suggestions-"
+BACKUP_SUFFIX = ".db.gz"
+
+
+def _lower_thread_priority():
+    # Compression is CPU-bound; on a small host it would otherwise compete with
+    # the event loop for the same core. Linux applies niceness per thread.
+    if sys.platform.startswith('linux'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError:
+            pass
+
+
+class BackupManager:
+    """Online, compressed snapshots of the suggestions database.
+
+    Snapshots are taken with the SQLite backup API a few pages at a time
+    from a low-priority worker thread, sleeping between steps so vote writes
+    on the shared connection only ever wait for a single step.
+    """
+
+    def __init__(self, db: Database, backup_dir: str = None, retention: int = None,
+                 pages_per_step: int = None, step_sleep: float = None):
+        self.db = db
+        self.backup_dir = backup_dir or Config.BACKUP_DIR
+        self.retention = Config.BACKUP_RETENTION if retention is None else retention
+        self.pages_per_step = pages_per_step or Config.BACKUP_PAGES_PER_STEP
+        self.step_sleep = Config.BACKUP_STEP_SLEEP if step_sleep is None else step_sleep
+        self._lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="backup", initializer=_lower_thread_priority
+        )
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def list_backups(self) -> List[str]:
+        """Return snapshot file names, newest first"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        names = [
+            name for name in os.listdir(self.backup_dir)
+            if name.startswith(BACKUP_PREFIX) and name.endswith(BACKUP_SUFFIX)
+        ]
+        return sorted(names, reverse=True)
+
+    async def create_backup(self) -> Optional[str]:
+        """Take a snapshot, apply retention and return the snapshot path"""
+        async with self._lock:
+            try:
+                path = await self._run(self._create_backup)
+                await self._run(self._apply_retention)
+                return path
+            except (sqlite3.Error, OSError) as e:
+                logging.error(f"Backup failed: {e}")
+                return None
+
+    async def restore_backup(self, name: str) -> bool:
+        """Restore a snapshot into the live database.
+
+        A fresh snapshot of the current data is taken first so a restore
+        can itself be undone.
+        """
+        path = self._resolve(name)
+        if not path:
+            return False
+        async with self._lock:
+            try:
+                await self._run(self._create_backup)
+                try:
+                    await self._run(self._restore_backup, path)
+                finally:
+                    # Only after the restore: the snapshot being restored may be the oldest
+                    await self._run(self._apply_retention)
+                return True
+            except (sqlite3.Error, OSError) as e:
+                logging.error(f"Restore of {name} failed: {e}")
+                return False
+
+    def _resolve(self, name: str) -> Optional[str]:
+        # Only accept names produced by list_backups to keep paths inside backup_dir
+        if name not in self.list_backups():
+            return None
+        return os.path.join(self.backup_dir, name)
+
+    def _create_backup(self) -> str:
+        os.makedirs(self.backup_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        path = os.path.join(self.backup_dir, f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}")
+
+        fd, raw_path = tempfile.mkstemp(suffix=".db", dir=self.backup_dir)
+        os.close(fd)
+        try:
+            self._snapshot(raw_path)
+            self._compress(raw_path, path)
+        finally:
+            os.remove(raw_path)
+
+        logging.info(f"Database backup written to {path}")
+        return path
+
+    def _snapshot(self, raw_path: str):
+        def pause(status, remaining, total):
+            # backup() only honours `sleep` when a step hits SQLITE_BUSY/LOCKED,
+            # so pause here to hand the connection back to writers between steps
+            if remaining:
+                time.sleep(self.step_sleep)
+
+        dest = sqlite3.connect(raw_path)
+        try:
+            self.db.get_connection().backup(
+                dest, pages=self.pages_per_step, progress=pause, sleep=self.step_sleep
+            )
+        finally:
+            dest.close()
+
+    def _compress(self, raw_path: str, path: str):
+        partial = path + ".part"
+        try:
+            with open(raw_path, 'rb') as src, gzip.open(partial, 'wb', compresslevel=6) as out:
+                shutil.copyfileobj(src, out)
+            os.replace(partial, path)
+        finally:
+            # list_backups ignores .part files, so retention would never clean one up
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def _restore_backup(self, path: str):
+        fd, raw_path = tempfile.mkstemp(suffix=".db", dir=self.backup_dir)
+        os.close(fd)
+        try:
+            with gzip.open(path, 'rb') as src, open(raw_path, 'wb') as out:
+                shutil.copyfileobj(src, out)
+            source = sqlite3.connect(raw_path)
+            try:
+                # Copy in a single step: the live database must not be written
+                # to while it is only partially overwritten.
+                source.backup(self.db.get_connection())
+            finally:
+                source.close()
+        finally:
+            os.remove(raw_path)
+
+        logging.info(f"Database restored from {path}")
+
+    def _apply_retention(self):
+        if self.retention <= 0:
+            return
+        for name in self.list_backups()[self.retention:]:
+            os.remove(os.path.join(self.backup_dir, name))
+            logging.info(f"Removed expired backup {name}")
@@ -4,6 +4,11 @@ import logging
 from typing import List, Dict, Optional, Tuple
 
 class Database:
+    # One connection per database file, shared by every cog. Backups read
+    # through this same connection so concurrent vote writes never force
+    # the SQLite backup API to restart.
+    _connections: Dict[str, sqlite3.Connection] = {}
+
     def __init__(self, db_file='suggestions.db'):
         self.db_file = db_file
         self.conn = None
@@ -11,7 +16,12 @@ class Database:
 
     def get_connection(self):
         if not self.conn:
-            self.conn = sqlite3.connect(self.db_file)
+            conn = Database._connections.get(self.db_file)
+            if conn is None:
+                # Backups run in a worker thread, so the connection must be shareable
+                conn = sqlite3.connect(self.db_file, check_same_thread=False)
+                Database._connections[self.db_file] = conn
+            self.conn = conn
         return self.conn
 
     def init_db(self):
@@ -235,3 +245,67 @@ class Database:
         except sqlite3.Error as e:
             logging.error(f"Database error in remove_vote: {e}")
             return False
+
+    def get_recent_suggestion_ids(self, days: int) -> set:
+        """Get the IDs of suggestions created in the last `days` days"""
+        try:
+            c = self.get_connection().cursor()
+            rows = c.execute("SELECT message_id FROM suggestions WHERE timestamp >= datetime('now', ?)",
+                             (f'-{days} days',)).fetchall()
+            return {row[0] for row in rows}
+        except sqlite3.Error as e:
+            logging.error(f"Database error in get_recent_suggestion_ids: {e}")
+            return set()
+
+    def get_votes_for_messages(self, message_ids: List[int]) -> Dict[int, Dict[int, str]]:
+        """Get votes for several suggestions as {message_id: {user_id: vote_type}}"""
+        votes = {message_id: {} for message_id in message_ids}
+        if not message_ids:
+            return votes
+        try:
+            c = self.get_connection().cursor()
+            placeholders = ", ".join("?" for _ in message_ids)
+            rows = c.execute(f"SELECT message_id, user_id, vote_type FROM votes WHERE message_id IN ({placeholders})",
+                             list(message_ids)).fetchall()
+            for message_id, user_id, vote_type in rows:
+                votes[message_id][user_id] = vote_type
+            return votes
+        except sqlite3.Error as e:
+            logging.error(f"Database error in get_votes_for_messages: {e}")
+            return votes
+
+    def apply_vote_corrections(self, additions: List[Tuple[int, int, str]],
+                               changes: List[Tuple[int, int, str, str]],
+                               removals: List[Tuple[int, int, str]]) -> Tuple[int, int, int]:
+        """Apply reconciled votes in a single transaction.
+
+        Every correction is conditional on the row still being in the state that
+        was read, so a live reaction event that landed in the meantime wins.
+        Changes are (message_id, user_id, new_vote, old_vote).
+        Returns the number of rows actually (added, changed, removed).
+        """
+        conn = self.get_connection()
+        try:
+            c = conn.cursor()
+            c.executemany("""
+                INSERT INTO votes (message_id, user_id, vote_type)
+                SELECT ?1, ?2, ?3
+                WHERE NOT EXISTS (SELECT 1 FROM votes WHERE message_id = ?1 AND user_id = ?2)
+            """, additions)
+            added = c.rowcount if additions else 0
+            c.executemany("""
+                UPDATE votes SET vote_type = ?3
+                WHERE message_id = ?1 AND user_id = ?2 AND vote_type = ?4
+            """, changes)
+            changed = c.rowcount if changes else 0
+            c.executemany("""
+                DELETE FROM votes 
+                WHERE message_id = ? AND user_id = ? AND vote_type = ?
+            """, removals)
+            removed = c.rowcount if removals else 0
+            conn.commit()
+            return added, changed, removed
+        except sqlite3.Error as e:
+            conn.rollback()
+            logging.error(f"Database error in apply_vote_corrections: {e}")
+            return 0, 0, 0
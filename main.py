@@ -10,9 +10,23 @@ load_dotenv()
 
 class SuggestionBot(commands.Bot):
     def __init__(self):
-        intents = discord.Intents.default()
-        intents.message_content = True
-        super().__init__(command_prefix=Config.COMMAND_PREFIX, intents=intents)
+        if Config.LOW_MEMORY_MODE:
+            # Commands arrive as interactions and votes as raw reaction payloads,
+            # so only guild structure and reactions are needed and the message,
+            # member and voice caches can be skipped entirely.
+            intents = discord.Intents.none()
+            intents.guilds = True
+            intents.guild_reactions = True
+            options = {
+                'max_messages': None,
+                'member_cache_flags': discord.MemberCacheFlags.none(),
+                'chunk_guilds_at_startup': False,
+            }
+        else:
+            intents = discord.Intents.default()
+            intents.message_content = True
+            options = {}
+        super().__init__(command_prefix=Config.COMMAND_PREFIX, intents=intents, **options)
         self.config = Config
 
     async def setup_hook(self):
@@ -0,0 +1,148 @@
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict
+
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval from a helper thread.
+
+    Stacks are aggregated in folded format ("outer;inner count"), which can be
+    fed straight into flamegraph tools.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def report(self, limit: int = 30) -> str:
+        total = sum(self.samples.values()) or 1
+        leaves = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+
+        out = io.StringIO()
+        out.write(f"{total} samples every {self.interval * 1000:.1f}ms\n\nTop frames:\n")
+        for frame, count in leaves.most_common(limit):
+            out.write(f"{count / total:7.2%}  {frame}\n")
+        return out.getvalue()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+async def profile_cpu(seconds: int, mode: str = "sampling") -> Dict[str, str]:
+    """Profile the event loop thread for `seconds` and return report files by name"""
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+        return {"cprofile.txt": out.getvalue()}
+
+    sampler = StackSampler(threading.get_ident())
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        await asyncio.to_thread(sampler.stop)
+    return {"samples.txt": sampler.report(), "samples.folded": sampler.folded()}
+
+
+async def profile_memory(seconds: int, limit: int = 25) -> Dict[str, str]:
+    """Diff tracemalloc snapshots taken `seconds` apart"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(10)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    out = io.StringIO()
+    out.write(f"Top {limit} allocation changes over {seconds}s:\n\n")
+    for stat in after.compare_to(before, "lineno")[:limit]:
+        out.write(f"{stat}\n")
+    out.write(f"\nTop {limit} allocation sites:\n\n")
+    for stat in after.statistics("lineno")[:limit]:
+        out.write(f"{stat}\n")
+    return {"tracemalloc.txt": out.getvalue()}
+
+
+class _SlowCallbackHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.records = []
+
+    def emit(self, record: logging.LogRecord):
+        if isinstance(record.msg, str) and record.msg.startswith("Executing"):
+            self.records.append(record.getMessage())
+
+
+async def dump_tasks(seconds: int, threshold: float = 0.1) -> Dict[str, str]:
+    """Dump every asyncio task stack, then watch for slow callbacks for `seconds`"""
+    out = io.StringIO()
+    tasks = asyncio.all_tasks()
+    out.write(f"{len(tasks)} tasks at {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    for task in tasks:
+        task.print_stack(limit=20, file=out)
+        out.write("\n")
+    files = {"tasks.txt": out.getvalue()}
+
+    if seconds > 0:
+        # Debug mode is what makes asyncio time each callback; enable it only for the window
+        loop = asyncio.get_running_loop()
+        debug, duration = loop.get_debug(), loop.slow_callback_duration
+        handler = _SlowCallbackHandler()
+        logger = logging.getLogger("asyncio")
+        logger.addHandler(handler)
+        loop.slow_callback_duration = threshold
+        loop.set_debug(True)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            loop.set_debug(debug)
+            loop.slow_callback_duration = duration
+            logger.removeHandler(handler)
+
+        out = io.StringIO()
+        out.write(f"Callbacks slower than {threshold * 1000:.0f}ms over {seconds}s: {len(handler.records)}\n\n")
+        for message in handler.records:
+            out.write(f"{message}\n")
+        files["slow_callbacks.txt"] = out.getvalue()
+    return files
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+import discord
+from config import Config
+from database.db import Database
+
+VOTE_EMOJIS = ('👍', '👎')
+
+
+class VoteReconciler:
+    """Re-sync stored votes with the reactions on recent suggestion messages.
+
+    Reaction events sent while the bot is offline are never replayed, so after
+    a (re)connect the reactors on each recent suggestion are fetched and the
+    `votes` table is corrected to match.
+    """
+
+    def __init__(self, bot, db: Database, days: int = None, concurrency: int = None, batch_size: int = None):
+        self.bot = bot
+        self.db = db
+        self.days = days or Config.RECONCILE_DAYS
+        self.batch_size = batch_size or Config.RECONCILE_BATCH_SIZE
+        # Bounds in-flight reactor fetches; discord.py still handles 429 backoff per bucket
+        self._semaphore = asyncio.Semaphore(concurrency or Config.RECONCILE_CONCURRENCY)
+        # (message_id, user_id) pairs written by live reaction events during a run
+        self._live_votes = None
+
+    def record_live_vote(self, message_id: int, user_id: int):
+        """Note a vote written by a reaction event so a running reconciliation leaves it alone"""
+        if self._live_votes is not None:
+            self._live_votes.add((message_id, user_id))
+
+    async def run(self) -> Dict[str, float]:
+        """Reconcile every configured suggestion channel and return drift stats"""
+        stats = {'messages': 0, 'failed': 0, 'added': 0, 'changed': 0, 'removed': 0, 'elapsed': 0.0, 'rate': 0.0}
+        start = time.perf_counter()
+        self._live_votes = set()
+
+        try:
+            suggestion_ids = self.db.get_recent_suggestion_ids(self.days)
+            if suggestion_ids:
+                cutoff = discord.utils.utcnow() - timedelta(days=self.days)
+                for guild in self.bot.guilds:
+                    channel_id = self.db.get_suggestion_channel(guild.id)
+                    if not channel_id:
+                        continue
+                    channel = self.bot.get_partial_messageable(channel_id, guild_id=guild.id)
+                    await self._reconcile_channel(channel, suggestion_ids, cutoff, stats)
+        finally:
+            self._live_votes = None
+
+        stats['elapsed'] = time.perf_counter() - start
+        stats['rate'] = stats['messages'] / stats['elapsed'] if stats['elapsed'] else 0.0
+        logging.info(
+            f"Vote reconciliation: {stats['messages']} messages in {stats['elapsed']:.1f}s "
+            f"({stats['rate']:.1f} msg/s), corrected {stats['added']} missing, "
+            f"{stats['changed']} changed and {stats['removed']} stale votes; "
+            f"{stats['failed']} messages could not be fetched"
+        )
+        return stats
+
+    async def _reconcile_channel(self, channel, suggestion_ids: set, cutoff, stats: Dict[str, float]):
+        batch = []
+        try:
+            async for message in channel.history(limit=None, after=cutoff):
+                if message.id not in suggestion_ids:
+                    continue
+                batch.append(message)
+                if len(batch) >= self.batch_size:
+                    await self._reconcile_batch(batch, stats)
+                    batch = []
+            if batch:
+                await self._reconcile_batch(batch, stats)
+        except discord.HTTPException as e:
+            logging.warning(f"Vote reconciliation stopped for channel {channel.id}: {e}")
+
+    async def _reconcile_batch(self, batch: List[discord.Message], stats: Dict[str, float]):
+        stored = self.db.get_votes_for_messages([message.id for message in batch])
+        results = await asyncio.gather(*(self._fetch_votes(message, stored[message.id]) for message in batch))
+
+        # The fetches can take seconds under rate limits. A reaction event in that
+        # window may make the fetched reactors stale without leaving any trace in
+        # the table (e.g. removing a vote we never stored), so pairs touched live
+        # are skipped, and the diff is taken against a fresh read with no await
+        # before the write.
+        stored = self.db.get_votes_for_messages([message.id for message in batch])
+        additions, changes, removals = [], [], []
+        for message, actual in zip(batch, results):
+            if actual is None:
+                continue
+            current = stored[message.id]
+            for user_id, vote in actual.items():
+                if (message.id, user_id) in self._live_votes:
+                    continue
+                if user_id not in current:
+                    additions.append((message.id, user_id, vote))
+                elif current[user_id] != vote:
+                    changes.append((message.id, user_id, vote, current[user_id]))
+            for user_id, vote in current.items():
+                if user_id not in actual and (message.id, user_id) not in self._live_votes:
+                    removals.append((message.id, user_id, vote))
+
+        if additions or changes or removals:
+            added, changed, removed = self.db.apply_vote_corrections(additions, changes, removals)
+            stats['added'] += added
+            stats['changed'] += changed
+            stats['removed'] += removed
+        failed = results.count(None)
+        stats['failed'] += failed
+        stats['messages'] += len(batch) - failed
+
+    async def _fetch_votes(self, message: discord.Message, current: Dict[int, str]) -> Optional[Dict[int, str]]:
+        """Return {user_id: vote_type} from the message reactions, or None if they could not be fetched"""
+        reactions = {str(r.emoji): r for r in message.reactions if str(r.emoji) in VOTE_EMOJIS}
+
+        # Reaction counts can match while the reactors differ, so every message
+        # is diffed user by user; only a message nobody but the bot reacted to
+        # can be resolved without fetching.
+        if all(reaction.count - reaction.me == 0 for reaction in reactions.values()):
+            return {}
+
+        actual = {}
+        async with self._semaphore:
+            try:
+                for emoji in VOTE_EMOJIS:
+                    reaction = reactions.get(emoji)
+                    if reaction is None:
+                        continue
+                    async for user in reaction.users():
+                        if user.id == self.bot.user.id:
+                            continue
+                        # A user holding both reactions keeps the vote we already have
+                        if user.id in actual and current.get(user.id) == actual[user.id]:
+                            continue
+                        actual[user.id] = emoji
+            except discord.HTTPException as e:
+                logging.warning(f"Could not fetch reactions for suggestion {message.id}: {e}")
+                return None
+        return actual